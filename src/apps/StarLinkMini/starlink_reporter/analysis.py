@@ -1,90 +1,204 @@
 """
 Core analysis functions for speed test data.
 """
-import statistics
 import os
-from datetime import datetime
-from typing import List, Dict, Any, Optional, Tuple
+import sys
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict, Any, Iterable, Optional, Tuple
 
-from rich.progress import track
+import numpy as np
 
+if sys.version_info >= (3, 11):
+    # fromisoformat accepts a trailing "Z" from Python 3.11 onwards.
+    parse_datetime = datetime.fromisoformat
+else:
 
-def extract_metrics(data: List[Dict[str, Any]]) -> Dict[str, List[float]]:
-    """Extract download, upload, and latency metrics from the data."""
-    metrics = {"download": [], "upload": [], "latency": []}
-    for entry in track(data, description="Processing speed test data..."):
-        try:
-            metrics["download"].append(entry["download"]["mbps"])
-            metrics["upload"].append(entry["upload"]["mbps"])
-            metrics["latency"].append(entry["ping"]["latency"])
-        except KeyError:
-            continue
-    return metrics
+    def parse_datetime(value: str) -> datetime:
+        """Parse an ISO 8601 timestamp, accepting a trailing "Z"."""
+        if value.endswith("Z"):
+            value = value[:-1] + "+00:00"
+        return datetime.fromisoformat(value)
+
+
+# Starting array size when scanning a stream of unknown length.
+STREAM_INITIAL_CAPACITY = 4096
+
+# Ranking name and sort direction; also the column layout used by rank_datasets.
+RANKING_CRITERIA = [
+    ("heuristic", True),
+    ("avg_download", True),
+    ("avg_upload", True),
+    ("avg_latency", False),
+    ("median_download", True),
+    ("median_upload", True),
+    ("median_latency", False),
+    ("max_download", True),
+    ("max_upload", True),
+    ("min_download", True),
+    ("min_upload", True),
+]
 
+# Share of each metric's stability in the overall stability score.
+STABILITY_WEIGHTS = {"download": 0.4, "upload": 0.3, "latency": 0.3}
 
-def calculate_statistics(values: List[float]) -> Dict[str, float]:
-    """Calculate min, median, max for a list of values."""
-    if not values:
-        return {"min": 0, "median": 0, "max": 0}
+
+def calculate_statistics(values: np.ndarray) -> Dict[str, float]:
+    """Calculate min, median, max, mean and sample std for an array of values."""
+    values = np.asarray(values, dtype=np.float64)
+    if values.size == 0:
+        return {"min": 0, "median": 0, "max": 0, "mean": 0, "std": 0}
+    last = values.size - 1
+    middle = values.size // 2
+    if values.size % 2:
+        ordered = np.partition(values, [0, middle, last])
+        median = ordered[middle]
+    else:
+        ordered = np.partition(values, [0, middle - 1, middle, last])
+        median = (ordered[middle - 1] + ordered[middle]) / 2
     return {
-        "min": min(values),
-        "median": statistics.median(values),
-        "max": max(values),
+        "min": float(ordered[0]),
+        "median": float(median),
+        "max": float(ordered[last]),
+        "mean": float(values.mean()),
+        "std": float(values.std(ddof=1)) if values.size > 1 else 0,
     }
 
 
-def get_directional_info(data: List[Dict[str, Any]]) -> Dict[str, Any]:
-    """Extract directional and tilt information."""
-    if not data:
-        return {}
-    directions = [entry.get("direction_degrees", 0) for entry in data]
-    tilts = [entry.get("tilt", 0) for entry in data]
+def summarize_directions(
+    direction_counts: Counter, tilt_counts: Counter
+) -> Dict[str, Any]:
+    """Build the directional info dict from direction and tilt counts."""
     return {
-        "direction_degrees": list(set(directions)),
-        "tilt_degrees": list(set(tilts)),
-        "primary_direction": statistics.mode(directions) if directions else 0,
-        "primary_tilt": statistics.mode(tilts) if tilts else 0,
+        "direction_degrees": list(direction_counts),
+        "tilt_degrees": list(tilt_counts),
+        "primary_direction": direction_counts.most_common(1)[0][0],
+        "primary_tilt": tilt_counts.most_common(1)[0][0],
+    }
+
+
+def parse_timestamps(values: List[str]) -> np.ndarray:
+    """Convert ISO 8601 timestamps to float64 epoch seconds in one batch."""
+    if all(isinstance(value, str) and value.endswith("Z") for value in values):
+        # NumPy parses naive ISO strings in C; the "Z" just marks them as UTC.
+        try:
+            stamps = np.array([value[:-1] for value in values], dtype="datetime64[us]")
+        except ValueError:
+            # Formats NumPy rejects (e.g. basic "20250630T191647") fall through.
+            pass
+        else:
+            if not np.isnat(stamps).any():
+                return stamps.astype(np.int64) / 1e6
+    return np.array([epoch_seconds(value) for value in values], dtype=np.float64)
+
+
+def epoch_seconds(value: str) -> float:
+    """Convert one ISO 8601 timestamp to epoch seconds, reading naive ones as UTC."""
+    stamp = parse_datetime(value)
+    if stamp.tzinfo is None:
+        stamp = stamp.replace(tzinfo=timezone.utc)
+    return stamp.timestamp()
+
+
+def scan_entries(
+    data: Iterable[Dict[str, Any]]
+) -> Tuple[Dict[str, np.ndarray], np.ndarray, Counter, Counter]:
+    """Collect metrics, epoch timestamps and antenna counts in a single pass."""
+    capacity = len(data) if isinstance(data, list) else STREAM_INITIAL_CAPACITY
+    download = np.empty(capacity)
+    upload = np.empty(capacity)
+    latency = np.empty(capacity)
+    timestamps = []
+    has_timestamps = True
+    direction_counts = Counter()
+    tilt_counts = Counter()
+    count = 0
+    for entry in data:
+        direction_counts[entry.get("direction_degrees", 0)] += 1
+        tilt_counts[entry.get("tilt", 0)] += 1
+        if count == capacity:
+            capacity *= 2
+            download = np.resize(download, capacity)
+            upload = np.resize(upload, capacity)
+            latency = np.resize(latency, capacity)
+        try:
+            download[count] = entry["download"]["mbps"]
+            upload[count] = entry["upload"]["mbps"]
+            latency[count] = entry["ping"]["latency"]
+        except KeyError:
+            continue
+        count += 1
+        if has_timestamps:
+            try:
+                timestamps.append(entry["timestamp"])
+            except KeyError:
+                has_timestamps = False
+                timestamps = []
+    metrics = {
+        "download": download[:count],
+        "upload": upload[:count],
+        "latency": latency[:count],
     }
+    try:
+        timestamps = parse_timestamps(timestamps)
+    except (ValueError, TypeError, AttributeError):
+        timestamps = np.empty(0)
+    return metrics, timestamps, direction_counts, tilt_counts
+
+
+def format_dataset_name(analysis: Dict[str, Any], case: str = "title") -> str:
+    """Formats the dataset name with directional info if available."""
+    base_name_raw = analysis["filename"].replace(".json", "").replace("_", " ")
+    base_name = base_name_raw.upper() if case == "upper" else base_name_raw.title()
+
+    dir_info = analysis.get("directional_info", {})
+    direction = dir_info.get("primary_direction")
+    tilt = dir_info.get("primary_tilt")
+
+    has_dir_info = (
+        direction is not None and tilt is not None and (direction != 0 or tilt != 0)
+    )
+
+    if has_dir_info:
+        return f"{base_name} ({direction}°/{tilt}°)"
+    return base_name
 
 
 def analyze_file_silent(
-    json_file: str, data: List[Dict[str, Any]]
+    json_file: str, data: Iterable[Dict[str, Any]]
 ) -> Optional[Dict[str, Any]]:
     """Analyze a single file's data and return results without printing."""
-    if not data:
+    metrics, timestamps, direction_counts, tilt_counts = scan_entries(data)
+    return build_analysis(json_file, metrics, timestamps, direction_counts, tilt_counts)
+
+
+def build_analysis(
+    json_file: str,
+    metrics: Dict[str, np.ndarray],
+    timestamps: np.ndarray,
+    direction_counts: Counter,
+    tilt_counts: Counter,
+) -> Optional[Dict[str, Any]]:
+    """Assemble the analysis result from the output of scan_entries."""
+    test_count = sum(direction_counts.values())
+    if not test_count:
         return None
 
-    metrics = extract_metrics(data)
-    directional_info = get_directional_info(data)
+    directional_info = summarize_directions(direction_counts, tilt_counts)
     download_stats = calculate_statistics(metrics["download"])
     upload_stats = calculate_statistics(metrics["upload"])
     latency_stats = calculate_statistics(metrics["latency"])
-    avg_download = statistics.mean(metrics["download"]) if metrics["download"] else 0
-    avg_upload = statistics.mean(metrics["upload"]) if metrics["upload"] else 0
-    avg_latency = statistics.mean(metrics["latency"]) if metrics["latency"] else 0
 
-    duration_str = "Unknown"
-    timestamps = []
-    if data:
-        try:
-            first_test = datetime.fromisoformat(
-                data[0]["timestamp"].replace("Z", "+00:00")
-            )
-            last_test = datetime.fromisoformat(
-                data[-1]["timestamp"].replace("Z", "+00:00")
-            )
-            duration = last_test - first_test
-            duration_str = str(duration)
-            for entry in data:
-                ts = datetime.fromisoformat(entry["timestamp"].replace("Z", "+00:00"))
-                timestamps.append(ts)
-        except (ValueError, KeyError):
-            pass
+    duration_str = (
+        str(timedelta(seconds=timestamps[-1] - timestamps[0]))
+        if timestamps.size
+        else "Unknown"
+    )
 
-    return {
+    result = {
         "filename": os.path.basename(json_file),
         "filepath": json_file,
-        "test_count": len(data),
+        "test_count": test_count,
         "duration": duration_str,
         "metrics": metrics,
         "timestamps": timestamps,
@@ -92,12 +206,15 @@ def analyze_file_silent(
         "upload_stats": upload_stats,
         "latency_stats": latency_stats,
         "averages": {
-            "download": avg_download,
-            "upload": avg_upload,
-            "latency": avg_latency,
+            "download": download_stats["mean"],
+            "upload": upload_stats["mean"],
+            "latency": latency_stats["mean"],
         },
         "directional_info": directional_info,
     }
+    result["heuristic_score"] = calculate_heuristic_score(result)
+    result["display_name"] = format_dataset_name(result)
+    return result
 
 
 def calculate_heuristic_score(analysis: Dict[str, Any]) -> float:
@@ -114,50 +231,55 @@ def rank_datasets(
     analyses: List[Dict[str, Any]]
 ) -> Dict[str, List[Tuple[str, float]]]:
     """Rank datasets by multiple criteria."""
-    rankings = {}
-    heuristic_scores = [
-        (a["filename"], calculate_heuristic_score(a)) for a in analyses
-    ]
-    rankings["heuristic"] = sorted(heuristic_scores, key=lambda x: x[1], reverse=True)
-    avg_download = [(a["filename"], a["averages"]["download"]) for a in analyses]
-    avg_upload = [(a["filename"], a["averages"]["upload"]) for a in analyses]
-    avg_latency = [(a["filename"], a["averages"]["latency"]) for a in analyses]
-    rankings["avg_download"] = sorted(avg_download, key=lambda x: x[1], reverse=True)
-    rankings["avg_upload"] = sorted(avg_upload, key=lambda x: x[1], reverse=True)
-    rankings["avg_latency"] = sorted(avg_latency, key=lambda x: x[1])
-    median_download = [(a["filename"], a["download_stats"]["median"]) for a in analyses]
-    median_upload = [(a["filename"], a["upload_stats"]["median"]) for a in analyses]
-    median_latency = [(a["filename"], a["latency_stats"]["median"]) for a in analyses]
-    rankings["median_download"] = sorted(
-        median_download, key=lambda x: x[1], reverse=True
-    )
-    rankings["median_upload"] = sorted(
-        median_upload, key=lambda x: x[1], reverse=True
+    names = [a["filename"] for a in analyses]
+    table = np.array(
+        [
+            (
+                a["heuristic_score"],
+                a["averages"]["download"],
+                a["averages"]["upload"],
+                a["averages"]["latency"],
+                a["download_stats"]["median"],
+                a["upload_stats"]["median"],
+                a["latency_stats"]["median"],
+                a["download_stats"]["max"],
+                a["upload_stats"]["max"],
+                a["download_stats"]["min"],
+                a["upload_stats"]["min"],
+            )
+            for a in analyses
+        ],
+        dtype=[(name, np.float64) for name, _ in RANKING_CRITERIA],
     )
-    rankings["median_latency"] = sorted(median_latency, key=lambda x: x[1])
-    max_download = [(a["filename"], a["download_stats"]["max"]) for a in analyses]
-    max_upload = [(a["filename"], a["upload_stats"]["max"]) for a in analyses]
-    rankings["max_download"] = sorted(max_download, key=lambda x: x[1], reverse=True)
-    rankings["max_upload"] = sorted(max_upload, key=lambda x: x[1], reverse=True)
-    min_download = [(a["filename"], a["download_stats"]["min"]) for a in analyses]
-    min_upload = [(a["filename"], a["upload_stats"]["min"]) for a in analyses]
-    rankings["min_download"] = sorted(min_download, key=lambda x: x[1], reverse=True)
-    rankings["min_upload"] = sorted(min_upload, key=lambda x: x[1], reverse=True)
+    rankings = {}
+    for name, descending in RANKING_CRITERIA:
+        column = table[name]
+        order = np.argsort(-column if descending else column, kind="stable")
+        rankings[name] = list(
+            zip([names[i] for i in order.tolist()], column[order].tolist())
+        )
     return rankings
 
 
+def sort_by_stability(analyses: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Order analyses from most to least stable overall."""
+    return sorted(
+        analyses,
+        key=lambda x: x["consistency"]["stability_scores"]["overall"],
+        reverse=True,
+    )
+
+
+def stability_score(cv: float) -> float:
+    """Convert a coefficient of variation into a 0-100 stability score."""
+    return max(0, 100 - (cv * 100))
+
+
 def calculate_consistency_metrics(analysis: Dict[str, Any]) -> Dict[str, Any]:
     """Calculate consistency and stability metrics for a single dataset."""
-    metrics = analysis["metrics"]
-    download_std = (
-        statistics.stdev(metrics["download"]) if len(metrics["download"]) > 1 else 0
-    )
-    upload_std = (
-        statistics.stdev(metrics["upload"]) if len(metrics["upload"]) > 1 else 0
-    )
-    latency_std = (
-        statistics.stdev(metrics["latency"]) if len(metrics["latency"]) > 1 else 0
-    )
+    download_std = analysis["download_stats"]["std"]
+    upload_std = analysis["upload_stats"]["std"]
+    latency_std = analysis["latency_stats"]["std"]
     download_cv = (
         download_std / analysis["averages"]["download"]
         if analysis["averages"]["download"] > 0
@@ -173,11 +295,13 @@ def calculate_consistency_metrics(analysis: Dict[str, Any]) -> Dict[str, Any]:
         if analysis["averages"]["latency"] > 0
         else 0
     )
-    download_stability = max(0, 100 - (download_cv * 100))
-    upload_stability = max(0, 100 - (upload_cv * 100))
-    latency_stability = max(0, 100 - (latency_cv * 100))
+    download_stability = stability_score(download_cv)
+    upload_stability = stability_score(upload_cv)
+    latency_stability = stability_score(latency_cv)
     overall_stability = (
-        download_stability * 0.4 + upload_stability * 0.3 + latency_stability * 0.3
+        download_stability * STABILITY_WEIGHTS["download"]
+        + upload_stability * STABILITY_WEIGHTS["upload"]
+        + latency_stability * STABILITY_WEIGHTS["latency"]
     )
     return {
         "standard_deviations": {
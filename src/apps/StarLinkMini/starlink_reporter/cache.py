@@ -0,0 +1,86 @@
+"""
+Caches per-file scan results so unchanged files are not parsed again.
+"""
+import json
+import os
+import zipfile
+from collections import Counter
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+# Bump when the layout of the cached scan changes.
+CACHE_VERSION = 1
+
+ScanResult = Tuple[Dict[str, np.ndarray], np.ndarray, Counter, Counter]
+
+
+def cache_path(json_file: str, cache_directory: str) -> str:
+    """Return the cache file used for a JSON data file."""
+    return os.path.join(cache_directory, os.path.basename(json_file) + ".npz")
+
+
+def source_signature(json_file: str) -> Dict[str, object]:
+    """Identify the current contents of a data file by path, size and mtime."""
+    stat = os.stat(json_file)
+    return {
+        "version": CACHE_VERSION,
+        "path": os.path.abspath(json_file),
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+    }
+
+
+def load_scan(json_file: str, cache_directory: str) -> Optional[ScanResult]:
+    """Return the cached scan of a file, or None if it is missing or stale."""
+    try:
+        with np.load(cache_path(json_file, cache_directory)) as cached:
+            meta = json.loads(cached["meta"].item())
+            if meta["source"] != source_signature(json_file):
+                return None
+            metrics = {
+                "download": cached["download"],
+                "upload": cached["upload"],
+                "latency": cached["latency"],
+            }
+            timestamps = cached["timestamps"]
+        direction_counts = Counter(dict(meta["direction_counts"]))
+        tilt_counts = Counter(dict(meta["tilt_counts"]))
+    except (OSError, KeyError, TypeError, ValueError, zipfile.BadZipFile):
+        return None
+    return metrics, timestamps, direction_counts, tilt_counts
+
+
+def save_scan(
+    json_file: str,
+    cache_directory: str,
+    scan: ScanResult,
+    signature: Dict[str, object],
+):
+    """Store a file's scan results; failures only mean the next run re-parses."""
+    metrics, timestamps, direction_counts, tilt_counts = scan
+    path = cache_path(json_file, cache_directory)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        # Skip the write if the file was rewritten while it was being scanned.
+        if source_signature(json_file) != signature:
+            return
+        meta = {
+            "source": signature,
+            "direction_counts": list(direction_counts.items()),
+            "tilt_counts": list(tilt_counts.items()),
+        }
+        os.makedirs(cache_directory, exist_ok=True)
+        with open(temp_path, "wb") as f:
+            np.savez(
+                f,
+                meta=np.array(json.dumps(meta)),
+                download=metrics["download"],
+                upload=metrics["upload"],
+                latency=metrics["latency"],
+                timestamps=timestamps,
+            )
+        os.replace(temp_path, path)
+    except (OSError, TypeError):
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
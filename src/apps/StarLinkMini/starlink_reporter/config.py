@@ -16,6 +16,9 @@ class AppConfig:
     reports_directory: str = os.path.join(
         os.path.dirname(os.path.dirname(__file__)), "reports"
     )
+    cache_directory: str = os.path.join(
+        os.path.dirname(os.path.dirname(__file__)), ".cache"
+    )
 
 
 def get_config() -> AppConfig:
@@ -1,33 +1,71 @@
 """
 Handles loading and validation of speed test data.
 """
-import json
-import glob
+import mmap
 import os
-from typing import List, Dict, Any, Optional
+from itertools import chain
+from typing import List, Dict, Any, Iterator, Optional
 
 from rich.console import Console
 
+try:
+    from orjson import loads as json_loads, JSONDecodeError
+
+    JSON_LOADS_BUFFERS = True
+except ImportError:
+    JSON_LOADS_BUFFERS = False
+    try:
+        from ujson import loads as json_loads, JSONDecodeError
+    except ImportError:
+        from json import loads as json_loads, JSONDecodeError
+
+try:
+    import ijson
+
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
 console = Console()
 
+# Files at least this large are memory-mapped instead of read into a copy.
+MMAP_MIN_BYTES = 64 * 1024
+
+# Files at least this large are streamed record by record when ijson is installed.
+STREAM_MIN_BYTES = 256 * 1024 * 1024
+
 
 def find_json_files(directory: str) -> List[str]:
     """Find all JSON files in the specified directory."""
-    pattern = os.path.join(directory, "*.json")
-    json_files = glob.glob(pattern)
+    try:
+        with os.scandir(directory) as entries:
+            json_files = [
+                entry.path
+                for entry in entries
+                if entry.name.endswith(".json")
+                and not entry.name.startswith(".")
+                and entry.is_file()
+            ]
+    except FileNotFoundError:
+        return []
     return sorted(json_files)
 
 
 def load_speed_data(json_file: str) -> Optional[List[Dict[str, Any]]]:
     """Load speed test data from a JSON file."""
     try:
-        with open(json_file, "r") as f:
-            data = json.load(f)
+        with open(json_file, "rb") as f:
+            if JSON_LOADS_BUFFERS and os.fstat(f.fileno()).st_size >= MMAP_MIN_BYTES:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    with memoryview(mm) as buffer:
+                        data = json_loads(buffer)
+            else:
+                data = json_loads(f.read())
         return data
     except FileNotFoundError:
         console.print(f"[red]Error: {json_file} not found![/red]")
         return None
-    except json.JSONDecodeError:
+    except JSONDecodeError:
         console.print(f"[red]Error: Invalid JSON in {json_file}![/red]")
         return None
 
@@ -37,21 +75,46 @@ def validate_schema(data: List[Dict[str, Any]]) -> bool:
     if not data or not isinstance(data, list):
         return False
 
-    required_fields = ["download", "upload", "ping"]
     sample = data[0]
+    try:
+        download = sample["download"]["mbps"]
+        upload = sample["upload"]["mbps"]
+        latency = sample["ping"]["latency"]
+    except (KeyError, TypeError):
+        return False
+    return (
+        isinstance(download, (int, float))
+        and isinstance(upload, (int, float))
+        and isinstance(latency, (int, float))
+    )
+
 
+def should_stream(json_file: str) -> bool:
+    """Return True if the file is large enough to stream instead of load."""
     try:
-        if not all(field in sample for field in required_fields):
-            return False
-        if not (
-            "mbps" in sample["download"]
-            and "mbps" in sample["upload"]
-            and "latency" in sample["ping"]
-        ):
-            return False
-        float(sample["download"]["mbps"])
-        float(sample["upload"]["mbps"])
-        float(sample["ping"]["latency"])
-        return True
-    except (KeyError, ValueError, TypeError):
+        return IJSON_AVAILABLE and os.path.getsize(json_file) >= STREAM_MIN_BYTES
+    except OSError:
         return False
+
+
+def stream_speed_data(json_file: str) -> Optional[Iterator[Dict[str, Any]]]:
+    """Stream speed test records from a JSON file after validating the first."""
+    records = _iter_records(json_file)
+    try:
+        first = next(records, None)
+    except ValueError:
+        console.print(f"[red]Error: Invalid JSON in {json_file}![/red]")
+        return None
+    if first is None or not validate_schema([first]):
+        records.close()
+        return None
+    return chain([first], records)
+
+
+def _iter_records(json_file: str) -> Iterator[Dict[str, Any]]:
+    """Yield each item of the top-level JSON array in the file."""
+    with open(json_file, "rb") as f:
+        try:
+            yield from ijson.items(f, "item", use_float=True)
+        except ijson.JSONError as exc:
+            raise ValueError(f"Invalid JSON in {json_file}") from exc
@@ -2,17 +2,53 @@
 
 import argparse
 import os
-import statistics
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Dict, Optional
 
 from rich.console import Console
 from rich.panel import Panel
 
-from . import analysis, data_loader
+from . import analysis, cache, data_loader
 from .config import get_config
 from .reporting import console_reporter, html_reporter, plotter
 
 console = Console()
 
+# Below this many files, --all analyzes serially to skip process pool start-up.
+PROCESS_POOL_MIN_FILES = 3
+
+
+def load_and_analyze(
+    json_file: str, cache_directory: Optional[str] = None
+) -> Optional[Dict[str, Any]]:
+    """Load, validate and analyze one file; safe to run in a worker process."""
+    if cache_directory:
+        scan = cache.load_scan(json_file, cache_directory)
+        if scan:
+            return analysis.build_analysis(json_file, *scan)
+        try:
+            # Taken before parsing so a rewrite mid-scan is never cached.
+            signature = cache.source_signature(json_file)
+        except OSError:
+            cache_directory = None
+    if data_loader.should_stream(json_file):
+        records = data_loader.stream_speed_data(json_file)
+        if records is None:
+            return None
+        try:
+            scan = analysis.scan_entries(records)
+        except ValueError:
+            console.print(f"[red]Error: Invalid JSON in {json_file}![/red]")
+            return None
+    else:
+        data = data_loader.load_speed_data(json_file)
+        if not data or not data_loader.validate_schema(data):
+            return None
+        scan = analysis.scan_entries(data)
+    if cache_directory:
+        cache.save_scan(json_file, cache_directory, scan, signature)
+    return analysis.build_analysis(json_file, *scan)
+
 
 def main():
     """Main analysis function."""
@@ -46,6 +82,11 @@ def main():
         action="store_true",
         help="Generate dedicated HTML consistency analysis report",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-parse every file instead of reusing cached analysis results",
+    )
     args = parser.parse_args()
     config = get_config()
 
@@ -68,18 +109,32 @@ def main():
             return
 
         console.print(f"[green]✓ Found {len(json_files)} JSON files[/green]")
-        valid_analyses = []
-        invalid_files = []
+        cache_directory = None if args.no_cache else config.cache_directory
+        results = {}
         with console.status("[bold green]Analyzing datasets...") as status:
-            for json_file in json_files:
-                status.update(f"[bold green]Analyzing {os.path.basename(json_file)}...")
-                data = data_loader.load_speed_data(json_file)
-                if data and data_loader.validate_schema(data):
-                    analysis_result = analysis.analyze_file_silent(json_file, data)
-                    if analysis_result:
-                        valid_analyses.append(analysis_result)
-                else:
-                    invalid_files.append(json_file)
+            if len(json_files) < PROCESS_POOL_MIN_FILES:
+                for json_file in json_files:
+                    results[json_file] = load_and_analyze(json_file, cache_directory)
+                    status.update(
+                        f"[bold green]Analyzed {os.path.basename(json_file)}..."
+                    )
+            else:
+                with ProcessPoolExecutor() as executor:
+                    futures = {
+                        executor.submit(
+                            load_and_analyze, json_file, cache_directory
+                        ): json_file
+                        for json_file in json_files
+                    }
+                    for future in as_completed(futures):
+                        json_file = futures[future]
+                        results[json_file] = future.result()
+                        status.update(
+                            f"[bold green]Analyzed {os.path.basename(json_file)}..."
+                        )
+
+        valid_analyses = [results[f] for f in json_files if results[f]]
+        invalid_files = [f for f in json_files if not results[f]]
 
         if not valid_analyses:
             console.print("[red]No valid speed test datasets found. Exiting.[/red]")
@@ -97,8 +152,13 @@ def main():
             item["consistency"] = analysis.calculate_consistency_metrics(item)
 
         rankings = analysis.rank_datasets(valid_analyses)
+        stability_order = (
+            analysis.sort_by_stability(valid_analyses)
+            if args.consistency or args.report or args.consistency_report
+            else None
+        )
         console_reporter.present_comparative_analysis(
-            valid_analyses, rankings, args.consistency
+            valid_analyses, rankings, args.consistency, stability_order
         )
 
         if args.plots:
@@ -114,7 +174,10 @@ def main():
                 "[bold green]Creating comprehensive analysis report..."
             ):
                 report_file = html_reporter.generate_html_report(
-                    valid_analyses, rankings, config.reports_directory
+                    valid_analyses,
+                    rankings,
+                    config.reports_directory,
+                    sorted_by_stability=stability_order,
                 )
             console.print(
                 Panel(
@@ -133,7 +196,9 @@ def main():
             )
             with console.status("[bold green]Creating consistency analysis report..."):
                 report_file = html_reporter.generate_consistency_html_report(
-                    valid_analyses, config.reports_directory
+                    valid_analyses,
+                    config.reports_directory,
+                    sorted_by_stability=stability_order,
                 )
             console.print(
                 Panel(
@@ -153,13 +218,16 @@ def main():
             return
 
         console.print(f"[green]✓ Loaded {len(data)} speed test records[/green]")
-        metrics = analysis.extract_metrics(data)
-        directional_info = analysis.get_directional_info(data)
+        with console.status("[bold green]Processing speed test data..."):
+            analysis_result = analysis.analyze_file_silent(args.file, data)
+        metrics = analysis_result["metrics"]
+        averages = analysis_result["averages"]
+        directional_info = analysis_result["directional_info"]
         console.print("\n")
-        summary_panel = console_reporter.create_summary_panel(data, metrics)
+        summary_panel = console_reporter.create_summary_panel(analysis_result)
         console.print(summary_panel)
         console.print("\n")
-        stats_table = console_reporter.create_statistics_table(metrics)
+        stats_table = console_reporter.create_statistics_table(analysis_result)
         console.print(stats_table)
         console.print("\n")
         directional_panel = console_reporter.create_directional_panel(directional_info)
@@ -170,16 +238,7 @@ def main():
             console.print(
                 "[bold yellow]📈 Consistency & Stability Analysis[/bold yellow]"
             )
-            analysis_obj = {
-                "filename": args.file,
-                "metrics": metrics,
-                "averages": {
-                    "download": sum(metrics["download"]) / len(metrics["download"]),
-                    "upload": sum(metrics["upload"]) / len(metrics["upload"]),
-                    "latency": sum(metrics["latency"]) / len(metrics["latency"]),
-                },
-            }
-            consistency = analysis.calculate_consistency_metrics(analysis_obj)
+            consistency = analysis.calculate_consistency_metrics(analysis_result)
             consistency_text = f"""
 📊 [bold]Standard Deviations[/bold] (Lower = More Consistent)
 • Download: [green]{consistency['standard_deviations']['download']:.2f} Mbps[/green]
@@ -206,26 +265,11 @@ def main():
                 "filename": args.file,
                 "test_count": len(data),
                 "metrics": metrics,
-                "averages": {
-                    "download": sum(metrics["download"]) / len(metrics["download"]),
-                    "upload": sum(metrics["upload"]) / len(metrics["upload"]),
-                    "latency": sum(metrics["latency"]) / len(metrics["latency"]),
-                },
-                "download_stats": {
-                    "min": min(metrics["download"]),
-                    "max": max(metrics["download"]),
-                    "median": statistics.median(metrics["download"]),
-                },
-                "upload_stats": {
-                    "min": min(metrics["upload"]),
-                    "max": max(metrics["upload"]),
-                    "median": statistics.median(metrics["upload"]),
-                },
-                "latency_stats": {
-                    "min": min(metrics["latency"]),
-                    "max": max(metrics["latency"]),
-                    "median": statistics.median(metrics["latency"]),
-                },
+                "averages": averages,
+                "download_stats": analysis_result["download_stats"],
+                "upload_stats": analysis_result["upload_stats"],
+                "latency_stats": analysis_result["latency_stats"],
+                "heuristic_score": analysis_result["heuristic_score"],
                 "duration": f"{len(data)} test samples",
             }
             with console.status("[bold green]Creating single-file report..."):
@@ -246,9 +290,7 @@ def main():
             )
 
         console.print("\n")
-        avg_download = (
-            statistics.mean(metrics["download"]) if metrics["download"] else 0
-        )
+        avg_download = averages["download"]
         if avg_download > 100:
             performance = "[bold green]Excellent! 🚀[/bold green]"
         elif avg_download > 50:
@@ -269,14 +311,8 @@ def main():
             console.print("\n")
             console.print("[bold]📈 Time Series Analysis[/bold]")
             if plotter.PLOTEXT_AVAILABLE:
-                analysis_result = analysis.analyze_file_silent(args.file, data)
-                if analysis_result:
-                    time_series_data = plotter.extract_time_series_data(
-                        [analysis_result]
-                    )
-                    plotter.create_time_series_plots(
-                        time_series_data, [analysis_result]
-                    )
+                time_series_data = plotter.extract_time_series_data([analysis_result])
+                plotter.create_time_series_plots(time_series_data, [analysis_result])
             else:
                 console.print(
                     "[yellow]⚠ plotext not available. Install with: pip install plotext[/yellow]"
@@ -1,9 +1,7 @@
 """
 Handles all console-based reporting.
 """
-import statistics
-from datetime import datetime
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Optional, Tuple
 
 from rich.console import Console
 from rich.table import Table
@@ -11,13 +9,12 @@ from rich.panel import Panel
 from rich.columns import Columns
 from rich import box
 
-from .utils import format_dataset_name
-from ..analysis import calculate_heuristic_score, calculate_statistics
+from ..analysis import sort_by_stability
 
 console = Console()
 
 
-def create_statistics_table(metrics: Dict[str, List[float]]) -> Table:
+def create_statistics_table(analysis: Dict[str, Any]) -> Table:
     """Create a Rich table with speed statistics."""
     table = Table(title="📊 Speed Test Statistics", box=box.ROUNDED)
     table.add_column("Metric", style="cyan", no_wrap=True)
@@ -26,7 +23,7 @@ def create_statistics_table(metrics: Dict[str, List[float]]) -> Table:
     table.add_column("Maximum", style="red")
     table.add_column("Unit", style="white")
 
-    download_stats = calculate_statistics(metrics["download"])
+    download_stats = analysis["download_stats"]
     table.add_row(
         "🔽 Download",
         f"{download_stats['min']:.2f}",
@@ -34,7 +31,7 @@ def create_statistics_table(metrics: Dict[str, List[float]]) -> Table:
         f"{download_stats['max']:.2f}",
         "Mbps",
     )
-    upload_stats = calculate_statistics(metrics["upload"])
+    upload_stats = analysis["upload_stats"]
     table.add_row(
         "🔼 Upload",
         f"{upload_stats['min']:.2f}",
@@ -42,7 +39,7 @@ def create_statistics_table(metrics: Dict[str, List[float]]) -> Table:
         f"{upload_stats['max']:.2f}",
         "Mbps",
     )
-    latency_stats = calculate_statistics(metrics["latency"])
+    latency_stats = analysis["latency_stats"]
     table.add_row(
         "📡 Latency",
         f"{latency_stats['min']:.2f}",
@@ -78,28 +75,17 @@ def create_directional_panel(directional_info: Dict[str, Any]) -> Panel:
     )
 
 
-def create_summary_panel(
-    data: List[Dict[str, Any]], metrics: Dict[str, List[float]]
-) -> Panel:
+def create_summary_panel(analysis: Dict[str, Any]) -> Panel:
     """Create a summary panel with key information."""
-    test_count = len(data)
-    time_span = ""
-    if data:
-        try:
-            first_test = datetime.fromisoformat(
-                data[0]["timestamp"].replace("Z", "+00:00")
-            )
-            last_test = datetime.fromisoformat(
-                data[-1]["timestamp"].replace("Z", "+00:00")
-            )
-            duration = last_test - first_test
-            time_span = f"⏱️ Test Duration: [bold]{duration}[/bold]"
-        except (ValueError, KeyError):
-            time_span = "⏱️ Test Duration: Unable to calculate"
+    test_count = analysis["test_count"]
+    if analysis["duration"] == "Unknown":
+        time_span = "⏱️ Test Duration: Unable to calculate"
+    else:
+        time_span = f"⏱️ Test Duration: [bold]{analysis['duration']}[/bold]"
 
-    avg_download = statistics.mean(metrics["download"]) if metrics["download"] else 0
-    avg_upload = statistics.mean(metrics["upload"]) if metrics["upload"] else 0
-    avg_latency = statistics.mean(metrics["latency"]) if metrics["latency"] else 0
+    avg_download = analysis["averages"]["download"]
+    avg_upload = analysis["averages"]["upload"]
+    avg_latency = analysis["averages"]["latency"]
 
     content = [
         f"📋 Total Tests: [bold cyan]{test_count}[/bold cyan]",
@@ -113,7 +99,7 @@ def create_summary_panel(
 
 def create_ranking_table(
     ranking_data: List[Tuple[str, float]],
-    analyses: List[Dict[str, Any]],
+    analyses_by_name: Dict[str, Dict[str, Any]],
     title: str,
     metric_unit: str = "",
     reverse_ranking: bool = False,
@@ -138,9 +124,9 @@ def create_ranking_table(
         else:
             rank_style = f"{idx}"
 
-        analysis = next((a for a in analyses if a["filename"] == filename), None)
+        analysis = analyses_by_name.get(filename)
         display_name = (
-            format_dataset_name(analysis)
+            analysis["display_name"]
             if analysis
             else filename.replace(".json", "").replace("_", " ").title()
         )
@@ -162,8 +148,8 @@ def create_summary_comparison_table(analyses: List[Dict[str, Any]]) -> Table:
     table.add_column("Duration", style="blue", justify="center")
 
     for analysis in analyses:
-        filename = format_dataset_name(analysis)
-        score = calculate_heuristic_score(analysis)
+        filename = analysis["display_name"]
+        score = analysis["heuristic_score"]
         table.add_row(
             filename,
             str(analysis["test_count"]),
@@ -180,7 +166,10 @@ def create_summary_comparison_table(analyses: List[Dict[str, Any]]) -> Table:
     return table
 
 
-def create_consistency_analysis_tables(analyses: List[Dict[str, Any]]) -> List[Table]:
+def create_consistency_analysis_tables(
+    analyses: List[Dict[str, Any]],
+    sorted_by_stability: Optional[List[Dict[str, Any]]] = None,
+) -> List[Table]:
     """Create Rich tables for consistency analysis."""
     tables = []
     std_table = Table(
@@ -192,7 +181,7 @@ def create_consistency_analysis_tables(analyses: List[Dict[str, Any]]) -> List[T
     std_table.add_column("Latency", style="red", justify="right")
 
     for analysis in analyses:
-        filename = format_dataset_name(analysis)
+        filename = analysis["display_name"]
         std = analysis["consistency"]["standard_deviations"]
         std_table.add_row(
             filename,
@@ -211,14 +200,11 @@ def create_consistency_analysis_tables(analyses: List[Dict[str, Any]]) -> List[T
     stability_table.add_column("Latency", style="red", justify="right")
     stability_table.add_column("Overall", style="bold magenta", justify="right")
 
-    sorted_by_stability = sorted(
-        analyses,
-        key=lambda x: x["consistency"]["stability_scores"]["overall"],
-        reverse=True,
-    )
+    if sorted_by_stability is None:
+        sorted_by_stability = sort_by_stability(analyses)
 
     for idx, analysis in enumerate(sorted_by_stability):
-        filename = format_dataset_name(analysis, case="upper")
+        filename = analysis["display_name"].upper()
         scores = analysis["consistency"]["stability_scores"]
         rank_display = f"#{idx + 1}"
         stability_table.add_row(
@@ -236,8 +222,11 @@ def present_comparative_analysis(
     analyses: List[Dict[str, Any]],
     rankings: Dict[str, List[Tuple[str, float]]],
     show_consistency: bool,
+    sorted_by_stability: Optional[List[Dict[str, Any]]] = None,
 ):
     """Present comprehensive comparative analysis with Rich formatting."""
+    analyses_by_name = {a["filename"]: a for a in analyses}
+
     console.print(
         Panel.fit(
             "[bold blue]📊 Comparative Analysis Results[/bold blue]\n[dim]Ranking datasets across multiple performance metrics[/dim]",
@@ -250,19 +239,19 @@ def present_comparative_analysis(
     console.print("\n")
     console.print("[bold]🏆 Performance Rankings[/bold]")
     heuristic_table = create_ranking_table(
-        rankings["heuristic"], analyses, "🎯 Overall Performance Score", "pts"
+        rankings["heuristic"], analyses_by_name, "🎯 Overall Performance Score", "pts"
     )
     avg_dl_table = create_ranking_table(
-        rankings["avg_download"], analyses, "📊 Average Download Speed", "Mbps"
+        rankings["avg_download"], analyses_by_name, "📊 Average Download Speed", "Mbps"
     )
     console.print("\n")
     console.print(Columns([heuristic_table, avg_dl_table]))
     avg_ul_table = create_ranking_table(
-        rankings["avg_upload"], analyses, "📈 Average Upload Speed", "Mbps"
+        rankings["avg_upload"], analyses_by_name, "📈 Average Upload Speed", "Mbps"
     )
     avg_lat_table = create_ranking_table(
         rankings["avg_latency"],
-        analyses,
+        analyses_by_name,
         "⚡ Average Latency",
         "ms",
         reverse_ranking=True,
@@ -272,14 +261,14 @@ def present_comparative_analysis(
     console.print("\n")
     console.print("[bold]📊 Median Performance Rankings[/bold]")
     med_dl_table = create_ranking_table(
-        rankings["median_download"], analyses, "🔽 Median Download Speed", "Mbps"
+        rankings["median_download"], analyses_by_name, "🔽 Median Download Speed", "Mbps"
     )
     med_ul_table = create_ranking_table(
-        rankings["median_upload"], analyses, "🔼 Median Upload Speed", "Mbps"
+        rankings["median_upload"], analyses_by_name, "🔼 Median Upload Speed", "Mbps"
     )
     med_lat_table = create_ranking_table(
         rankings["median_latency"],
-        analyses,
+        analyses_by_name,
         "📡 Median Latency",
         "ms",
         reverse_ranking=True,
@@ -288,42 +277,44 @@ def present_comparative_analysis(
     console.print("\n")
     console.print("[bold]🚀 Peak Performance Rankings[/bold]")
     max_dl_table = create_ranking_table(
-        rankings["max_download"], analyses, "⚡ Maximum Download Speed", "Mbps"
+        rankings["max_download"], analyses_by_name, "⚡ Maximum Download Speed", "Mbps"
     )
     max_ul_table = create_ranking_table(
-        rankings["max_upload"], analyses, "⚡ Maximum Upload Speed", "Mbps"
+        rankings["max_upload"], analyses_by_name, "⚡ Maximum Upload Speed", "Mbps"
     )
     console.print(Columns([max_dl_table, max_ul_table]))
     console.print("\n")
     console.print("[bold]📉 Minimum Performance Rankings[/bold]")
     min_dl_table = create_ranking_table(
-        rankings["min_download"], analyses, "🔻 Minimum Download Speed", "Mbps"
+        rankings["min_download"], analyses_by_name, "🔻 Minimum Download Speed", "Mbps"
     )
     min_ul_table = create_ranking_table(
-        rankings["min_upload"], analyses, "🔻 Minimum Upload Speed", "Mbps"
+        rankings["min_upload"], analyses_by_name, "🔻 Minimum Upload Speed", "Mbps"
     )
     console.print(Columns([min_dl_table, min_ul_table]))
 
     if show_consistency:
         console.print("\n")
         console.print("[bold yellow]📈 Consistency & Stability Analysis[/bold yellow]")
-        consistency_tables = create_consistency_analysis_tables(analyses)
+        consistency_tables = create_consistency_analysis_tables(
+            analyses, sorted_by_stability
+        )
         for table in consistency_tables:
             console.print("\n")
             console.print(table)
 
     if rankings["heuristic"]:
         winner_filename = rankings["heuristic"][0][0]
-        winner_analysis = next(
-            (a for a in analyses if a["filename"] == winner_filename), None
-        )
+        winner_analysis = analyses_by_name.get(winner_filename)
         stability_info = ""
         if winner_analysis:
-            winner_name = format_dataset_name(winner_analysis)
+            winner_name = winner_analysis["display_name"]
             stability_score = winner_analysis["consistency"]["stability_scores"][
                 "overall"
             ]
-            stability_info = f"\nStability Score: [bold cyan]{stability_score:.1f}/100[/bold cyan]"
+            stability_info = (
+                f"\nStability Score: [bold cyan]{stability_score:.1f}/100[/bold cyan]"
+            )
         else:
             winner_name = winner_filename.replace(".json", "").replace("_", " ").title()
         console.print("\n")
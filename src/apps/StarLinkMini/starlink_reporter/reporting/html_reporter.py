@@ -1,17 +1,35 @@
 """
 Handles all HTML report generation.
 """
+import json
 import os
+import re
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 
-from ..analysis import calculate_heuristic_score
-from .utils import format_dataset_name
+from ..analysis import format_dataset_name, sort_by_stability
 
+# Write buffer for report files, so sections go to disk in a few large writes.
+WRITE_BUFFER_BYTES = 64 * 1024
 
-def get_common_css() -> str:
-    """Get the common CSS styles for all reports."""
-    return """
+# Sidecar next to index.html holding one {href, title, desc, ts} entry per
+# report, newest first; index.html is rendered from it.
+INDEX_LINKS_FILE = "index_links.json"
+
+# One report link as written into index.html by earlier, sidecar-less versions.
+LEGACY_INDEX_LINK = re.compile(
+    r'<a href="([^"]*)" class="report-link">\s*(.*?)\s*'
+    r'<div class="report-meta">(.*?) • Generated: (.*?)</div>\s*</a>',
+    re.DOTALL,
+)
+
+# Entries already read or written this run, keyed by sidecar path and
+# remembered with the (mtime_ns, size) the file had at the time.
+index_links_cache: Dict[str, Tuple[Tuple[int, int], List[Dict[str, str]]]] = {}
+
+
+# Stylesheet shared by every report and the reports index.
+COMMON_CSS = """
             body { 
                 font-family: 'Monaco', 'Menlo', 'Ubuntu Mono', 'Consolas', 'source-code-pro', monospace;
                 line-height: 1.4;
@@ -176,11 +194,55 @@ def get_common_css() -> str:
 
 def ensure_reports_directory(reports_dir: str) -> str:
     """Ensure the reports directory exists and return its path."""
-    if not os.path.exists(reports_dir):
-        os.makedirs(reports_dir)
+    os.makedirs(reports_dir, exist_ok=True)
     return reports_dir
 
 
+def read_legacy_index_links(index_path: str) -> List[Dict[str, str]]:
+    """Import the report links from an index.html written without a sidecar."""
+    try:
+        with open(index_path, "r", encoding="utf-8") as f:
+            content = f.read()
+    except OSError:
+        return []
+    _, start_marker, rest = content.partition("<!-- REPORTS_START -->")
+    links_section, end_marker, _ = rest.partition("<!-- REPORTS_END -->")
+    if not (start_marker and end_marker):
+        return []
+    return [
+        {"href": href, "title": title, "desc": desc, "ts": ts}
+        for href, title, desc, ts in LEGACY_INDEX_LINK.findall(links_section)
+    ]
+
+
+def load_index_links(reports_dir: str) -> List[Dict[str, str]]:
+    """Load the existing report link entries for the index, newest first."""
+    links_path = os.path.join(reports_dir, INDEX_LINKS_FILE)
+    try:
+        stat = os.stat(links_path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cached = index_links_cache.get(links_path)
+        if cached and cached[0] == signature:
+            return list(cached[1])
+        with open(links_path, encoding="utf-8") as f:
+            entries = json.load(f)
+        if isinstance(entries, list) and all(isinstance(e, dict) for e in entries):
+            index_links_cache[links_path] = (signature, entries)
+            return list(entries)
+    except (OSError, ValueError):
+        pass
+    return read_legacy_index_links(os.path.join(reports_dir, "index.html"))
+
+
+def render_index_link(entry: Dict[str, str]) -> str:
+    """Render one report link entry for the reports index."""
+    return f"""
+                <a href="{entry['href']}" class="report-link">
+                    {entry['title']}
+                    <div class="report-meta">{entry['desc']} • Generated: {entry['ts']}</div>
+                </a>"""
+
+
 def update_reports_index(
     reports_dir: str,
     report_filename: str,
@@ -190,31 +252,19 @@ def update_reports_index(
     """Update the reports index.html with a new report link."""
     reports_dir = ensure_reports_directory(reports_dir)
     index_path = os.path.join(reports_dir, "index.html")
-    existing_links = []
-    if os.path.exists(index_path):
-        try:
-            with open(index_path, "r", encoding="utf-8") as f:
-                content = f.read()
-                start_marker = "<!-- REPORTS_START -->"
-                end_marker = "<!-- REPORTS_END -->"
-                if start_marker in content and end_marker in content:
-                    start_idx = content.find(start_marker) + len(start_marker)
-                    end_idx = content.find(end_marker)
-                    existing_links_section = content[start_idx:end_idx].strip()
-                    if existing_links_section:
-                        existing_links = [existing_links_section]
-        except Exception:
-            existing_links = []
+    existing_entries = load_index_links(reports_dir)
 
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    new_link = f"""
-                <a href="{report_filename}" class="report-link">
-                    {report_title}
-                    <div class="report-meta">{report_description} • Generated: {timestamp}</div>
-                </a>"""
-    all_links = [new_link] + existing_links
-    links_html = "\n".join(all_links)
-    total_reports = len(all_links)
+    now = datetime.now()
+    timestamp = now.strftime("%Y-%m-%d %H:%M:%S")
+    new_entry = {
+        "href": report_filename,
+        "title": report_title,
+        "desc": report_description,
+        "ts": timestamp,
+    }
+    entries = [new_entry] + existing_entries
+    links_html = "\n".join(render_index_link(entry) for entry in entries)
+    total_reports = len(entries)
     index_content = f"""
     <!DOCTYPE html>
     <html lang="en">
@@ -222,7 +272,7 @@ def update_reports_index(
         <meta charset="UTF-8">
         <meta name="viewport" content="width=device-width, initial-scale=1.0">
         <title>Starlink Analysis Reports</title>
-        <style>{get_common_css()}</style>
+        <style>{COMMON_CSS}</style>
     </head>
     <body>
         <div class="container">
@@ -245,8 +295,8 @@ def update_reports_index(
                 </div>
                 <div class="summary-card">
                     <h3>Last Updated</h3>
-                    <div class="value">{datetime.now().strftime('%H:%M')}</div>
-                    <div class="unit">{datetime.now().strftime('%Y-%m-%d')}</div>
+                    <div class="value">{now.strftime('%H:%M')}</div>
+                    <div class="unit">{now.strftime('%Y-%m-%d')}</div>
                 </div>
             </div>
 
@@ -260,8 +310,13 @@ def update_reports_index(
     </body>
     </html>
     """
-    with open(index_path, "w", encoding="utf-8") as f:
+    with open(index_path, "w", encoding="utf-8", newline="") as f:
         f.write(index_content)
+    links_path = os.path.join(reports_dir, INDEX_LINKS_FILE)
+    with open(links_path, "w", encoding="utf-8") as f:
+        json.dump(entries, f)
+    stat = os.stat(links_path)
+    index_links_cache[links_path] = ((stat.st_mtime_ns, stat.st_size), entries)
     return index_path
 
 
@@ -269,23 +324,28 @@ def generate_consistency_html_report(
     analyses: List[Dict[str, Any]],
     reports_dir: str,
     output_file: str = "consistency_analysis.html",
+    sorted_by_stability: Optional[List[Dict[str, Any]]] = None,
 ):
     """Generate a dedicated HTML consistency analysis report."""
     reports_dir = ensure_reports_directory(reports_dir)
     output_path = os.path.join(reports_dir, output_file)
-    sorted_by_stability = sorted(
-        analyses,
-        key=lambda x: x["consistency"]["stability_scores"]["overall"],
-        reverse=True,
-    )
-    html_content = f"""
+    if sorted_by_stability is None:
+        sorted_by_stability = sort_by_stability(analyses)
+    report_names = {
+        a["filename"]: format_dataset_name(a, case="upper") for a in analyses
+    }
+    with open(
+        output_path, "w", encoding="utf-8", newline="", buffering=WRITE_BUFFER_BYTES
+    ) as f:
+        f.write(
+            f"""
     <!DOCTYPE html>
     <html lang="en">
     <head>
         <meta charset="UTF-8">
         <meta name="viewport" content="width=device-width, initial-scale=1.0">
         <title>Starlink Consistency Analysis Report</title>
-        <style>{get_common_css()}</style>
+        <style>{COMMON_CSS}</style>
     </head>
     <body>
         <div class="container">
@@ -337,12 +397,14 @@ def generate_consistency_html_report(
                     <th>Overall Score</th>
                 </tr>
     """
-    for idx, analysis in enumerate(sorted_by_stability):
-        filename = format_dataset_name(analysis, case="upper")
-        scores = analysis["consistency"]["stability_scores"]
-        rank_class = f"rank-{idx + 1}" if idx < 3 else ""
-        rank_display = f"#{idx + 1}"
-        html_content += f"""
+        )
+        for idx, analysis in enumerate(sorted_by_stability):
+            filename = report_names[analysis["filename"]]
+            scores = analysis["consistency"]["stability_scores"]
+            rank_class = f"rank-{idx + 1}" if idx < 3 else ""
+            rank_display = f"#{idx + 1}"
+            f.write(
+                f"""
                 <tr class="{rank_class}">
                     <td><strong>{rank_display}</strong></td>
                     <td>{filename}</td>
@@ -352,8 +414,10 @@ def generate_consistency_html_report(
                     <td><strong>{scores['overall']:.1f}</strong></td>
                 </tr>
         """
-    html_content += "</table>"
-    html_content += """
+            )
+        f.write("</table>")
+        f.write(
+            """
             <h2>VARIABILITY ANALYSIS</h2>
             <h3>STANDARD DEVIATIONS (LOWER = MORE CONSISTENT)</h3>
             <table>
@@ -365,20 +429,22 @@ def generate_consistency_html_report(
                     <th>Consistency Grade</th>
                 </tr>
     """
-    for analysis in analyses:
-        filename = format_dataset_name(analysis, case="upper")
-        std = analysis["consistency"]["standard_deviations"]
-        overall_stability = analysis["consistency"]["stability_scores"]["overall"]
-        if overall_stability >= 80:
-            grade = "EXCELLENT"
-            grade_class = "metric-good"
-        elif overall_stability >= 60:
-            grade = "GOOD"
-            grade_class = "metric-average"
-        else:
-            grade = "VARIABLE"
-            grade_class = "metric-poor"
-        html_content += f"""
+        )
+        for analysis in analyses:
+            filename = report_names[analysis["filename"]]
+            std = analysis["consistency"]["standard_deviations"]
+            overall_stability = analysis["consistency"]["stability_scores"]["overall"]
+            if overall_stability >= 80:
+                grade = "EXCELLENT"
+                grade_class = "metric-good"
+            elif overall_stability >= 60:
+                grade = "GOOD"
+                grade_class = "metric-average"
+            else:
+                grade = "VARIABLE"
+                grade_class = "metric-poor"
+            f.write(
+                f"""
                 <tr>
                     <td><strong>{filename}</strong></td>
                     <td>{std['download']:.2f} Mbps</td>
@@ -387,8 +453,10 @@ def generate_consistency_html_report(
                     <td class="{grade_class}"><strong>{grade}</strong></td>
                 </tr>
         """
-    html_content += "</table>"
-    html_content += """
+            )
+        f.write("</table>")
+        f.write(
+            """
             <h2>DETAILED CONSISTENCY METRICS</h2>
             <h3>COEFFICIENT OF VARIATION ANALYSIS</h3>
             <table>
@@ -400,17 +468,19 @@ def generate_consistency_html_report(
                     <th>Performance Notes</th>
                 </tr>
     """
-    for analysis in analyses:
-        filename = format_dataset_name(analysis, case="upper")
-        cv = analysis["consistency"]["coefficients_of_variation"]
-        avg_cv = (cv["download"] + cv["upload"] + cv["latency"]) / 3
-        if avg_cv < 0.2:
-            notes = "Very stable connection"
-        elif avg_cv < 0.4:
-            notes = "Generally stable"
-        else:
-            notes = "Variable performance"
-        html_content += f"""
+        )
+        for analysis in analyses:
+            filename = report_names[analysis["filename"]]
+            cv = analysis["consistency"]["coefficients_of_variation"]
+            avg_cv = (cv["download"] + cv["upload"] + cv["latency"]) / 3
+            if avg_cv < 0.2:
+                notes = "Very stable connection"
+            elif avg_cv < 0.4:
+                notes = "Generally stable"
+            else:
+                notes = "Variable performance"
+            f.write(
+                f"""
                 <tr>
                     <td><strong>{filename}</strong></td>
                     <td>{cv['download']:.3f}</td>
@@ -419,8 +489,10 @@ def generate_consistency_html_report(
                     <td>{notes}</td>
                 </tr>
         """
-    html_content += "</table>"
-    html_content += f"""
+            )
+        f.write("</table>")
+        f.write(
+            f"""
             <div class="timestamp">
                 Consistency analysis generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
             </div>
@@ -428,8 +500,7 @@ def generate_consistency_html_report(
     </body>
     </html>
     """
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write(html_content)
+        )
     report_desc = f"Stability analysis of {len(analyses)} dataset(s)"
     update_reports_index(
         reports_dir, output_file, "Consistency Analysis", report_desc
@@ -442,18 +513,29 @@ def generate_html_report(
     rankings: Dict[str, Any],
     reports_dir: str,
     output_file: str = "comprehensive_analysis.html",
+    sorted_by_stability: Optional[List[Dict[str, Any]]] = None,
 ):
     """Generate a comprehensive HTML report."""
     reports_dir = ensure_reports_directory(reports_dir)
     output_path = os.path.join(reports_dir, output_file)
-    html_content = f"""
+    report_names = {
+        a["filename"]: format_dataset_name(a, case="upper") for a in analyses
+    }
+    champion = report_names[
+        rankings["heuristic"][0][0] if rankings else analyses[0]["filename"]
+    ]
+    with open(
+        output_path, "w", encoding="utf-8", newline="", buffering=WRITE_BUFFER_BYTES
+    ) as f:
+        f.write(
+            f"""
     <!DOCTYPE html>
     <html lang="en">
     <head>
         <meta charset="UTF-8">
         <meta name="viewport" content="width=device-width, initial-scale=1.0">
         <title>Starlink Speed Test Analysis Report</title>
-        <style>{get_common_css()}</style>
+        <style>{COMMON_CSS}</style>
     </head>
     <body>
         <div class="container">
@@ -481,11 +563,13 @@ def generate_html_report(
                 </div>
                 <div class="summary-card">
                     <h3>Champion</h3>
-                    <div class="value">{(format_dataset_name(next(a for a in analyses if a["filename"] == rankings['heuristic'][0][0]), case='upper')) if rankings else format_dataset_name(analyses[0], case='upper')}</div>
+                    <div class="value">{champion}</div>
                 </div>
             </div>
     """
-    html_content += """
+        )
+        f.write(
+            """
             <h2>DATASET COMPARISON OVERVIEW</h2>
             <table>
                 <tr>
@@ -498,10 +582,12 @@ def generate_html_report(
                     <th>Duration</th>
                 </tr>
     """
-    for analysis in analyses:
-        filename = format_dataset_name(analysis, case="upper")
-        score = calculate_heuristic_score(analysis)
-        html_content += f"""
+        )
+        for analysis in analyses:
+            filename = report_names[analysis["filename"]]
+            score = analysis["heuristic_score"]
+            f.write(
+                f"""
                 <tr>
                     <td><strong>{filename}</strong></td>
                     <td>{analysis['test_count']}</td>
@@ -512,32 +598,33 @@ def generate_html_report(
                     <td>{analysis['duration'].split('.')[0] if '.' in analysis['duration'] else analysis['duration']}</td>
                 </tr>
         """
-    html_content += "</table>"
-    if rankings:
-        html_content += """
+            )
+        f.write("</table>")
+        if rankings:
+            f.write(
+                """
                 <h2>PERFORMANCE RANKINGS</h2>
                 <h3>OVERALL PERFORMANCE SCORE</h3>
                 <table>
                     <tr><th>Rank</th><th>Dataset</th><th>Score</th></tr>
         """
-        for idx, (filename, score) in enumerate(rankings["heuristic"]):
-            rank_class = f"rank-{idx + 1}" if idx < 3 else ""
-            rank_display = f"#{idx + 1}"
-            analysis = next((a for a in analyses if a["filename"] == filename), None)
-            display_name = (
-                format_dataset_name(analysis, case="upper")
-                if analysis
-                else filename.upper()
             )
-            html_content += f"""
+            for idx, (filename, score) in enumerate(rankings["heuristic"]):
+                rank_class = f"rank-{idx + 1}" if idx < 3 else ""
+                rank_display = f"#{idx + 1}"
+                display_name = report_names.get(filename, filename.upper())
+                f.write(
+                    f"""
                     <tr class="{rank_class}">
                         <td><strong>{rank_display}</strong></td>
                         <td>{display_name}</td>
                         <td>{score:.2f}</td>
                     </tr>
             """
-        html_content += "</table>"
-        html_content += """
+                )
+            f.write("</table>")
+            f.write(
+                """
                 <h2>CONSISTENCY OVERVIEW</h2>
                 <h3>TOP STABILITY SCORES</h3>
                 <table>
@@ -547,25 +634,26 @@ def generate_html_report(
                         <th>Overall Stability</th>
                     </tr>
         """
-        sorted_by_stability = sorted(
-            analyses,
-            key=lambda x: x["consistency"]["stability_scores"]["overall"],
-            reverse=True,
-        )
-        for idx, analysis in enumerate(sorted_by_stability[:5]):
-            filename = format_dataset_name(analysis, case="upper")
-            scores = analysis["consistency"]["stability_scores"]
-            rank_class = f"rank-{idx + 1}" if idx < 3 else ""
-            rank_display = f"#{idx + 1}"
-            html_content += f"""
+            )
+            if sorted_by_stability is None:
+                sorted_by_stability = sort_by_stability(analyses)
+            for idx, analysis in enumerate(sorted_by_stability[:5]):
+                filename = report_names[analysis["filename"]]
+                scores = analysis["consistency"]["stability_scores"]
+                rank_class = f"rank-{idx + 1}" if idx < 3 else ""
+                rank_display = f"#{idx + 1}"
+                f.write(
+                    f"""
                     <tr class="{rank_class}">
                         <td><strong>{rank_display}</strong></td>
                         <td>{filename}</td>
                         <td><strong>{scores['overall']:.1f}/100</strong></td>
                     </tr>
             """
-        html_content += "</table>"
-    html_content += f"""
+                )
+            f.write("</table>")
+        f.write(
+            f"""
             <div class="timestamp">
                 Report generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
             </div>
@@ -573,8 +661,7 @@ def generate_html_report(
     </body>
     </html>
     """
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write(html_content)
+        )
     report_desc = f"Comprehensive analysis of {len(analyses)} dataset(s)"
     update_reports_index(
         reports_dir, output_file, "Comprehensive Analysis", report_desc
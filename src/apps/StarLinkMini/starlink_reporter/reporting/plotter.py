@@ -2,12 +2,12 @@
 Hangles time series plotting using plotext.
 """
 from datetime import datetime
-from typing import List, Dict, Any
+from itertools import cycle
+from typing import List, Dict, Any, Tuple
 
+import numpy as np
 from rich.console import Console
 
-from .utils import format_dataset_name
-
 try:
     import plotext as plt
 
@@ -17,25 +17,24 @@ except ImportError:
 
 console = Console()
 
+PLOT_COLORS = ["red", "green", "blue", "yellow", "magenta", "cyan", "white"]
+PLOT_WIDTH = 80
+PLOT_HEIGHT = 20
+
 
 def extract_time_series_data(
     analyses: List[Dict[str, Any]],
-) -> Dict[str, Dict[str, List]]:
+) -> Dict[str, Dict[str, np.ndarray]]:
     """Extract time series data from all analyses for plotting."""
     time_series = {}
     for analysis in analyses:
         filename = analysis["filename"]
         timestamps = analysis.get("timestamps", [])
         metrics = analysis["metrics"]
-        if not timestamps:
-            num_points = len(metrics["download"])
-            timestamps = list(range(num_points))
+        if not len(timestamps):
+            timestamps = np.arange(len(metrics["download"]))
         else:
-            if timestamps:
-                start_time = timestamps[0]
-                timestamps = [
-                    (ts - start_time).total_seconds() / 60 for ts in timestamps
-                ]
+            timestamps = (timestamps - timestamps[0]) / 60.0
         time_series[filename] = {
             "timestamps": timestamps,
             "download_speeds": metrics["download"],
@@ -45,8 +44,64 @@ def extract_time_series_data(
     return time_series
 
 
+def _axis_limits(
+    time_series_data: Dict[str, Dict[str, np.ndarray]], series_key: str
+) -> Tuple[float, float]:
+    """Return padded y-axis limits spanning one metric across all datasets."""
+    values = np.concatenate([data[series_key] for data in time_series_data.values()])
+    low = float(values.min())
+    high = float(values.max())
+    padding = (high - low) * 0.1
+    return max(0, low - padding), high + padding
+
+
+def _plot_series(
+    time_series_data: Dict[str, Dict[str, np.ndarray]],
+    analyses: List[Dict[str, Any]],
+) -> List[Tuple[str, str, List[float], Dict[str, np.ndarray]]]:
+    """Resolve label, color and x values for each dataset once for all plots."""
+    display_names = {a["filename"]: a["display_name"] for a in analyses}
+    series = []
+    for (filename, data), color in zip(time_series_data.items(), cycle(PLOT_COLORS)):
+        label = (
+            display_names[filename]
+            if filename in display_names
+            else filename.replace(".json", "").replace("_", " ").title()
+        )
+        series.append((label, color, data["timestamps"].tolist(), data))
+    return series
+
+
+def _render_series(
+    series: List[Tuple[str, str, List[float], Dict[str, np.ndarray]]],
+    series_key: str,
+    title: str,
+    x_label: str,
+    y_label: str,
+    y_min: float,
+    y_max: float,
+):
+    """Plot one metric for every dataset on a shared set of axes."""
+    plt.clf()
+    plt.plotsize(PLOT_WIDTH, PLOT_HEIGHT)
+    plt.title(title)
+    plt.xlabel(x_label)
+    plt.ylabel(y_label)
+    for label, color, timestamps, data in series:
+        plt.plot(
+            timestamps,
+            data[series_key].tolist(),
+            label=label,
+            color=color,
+            marker="braille",
+        )
+    plt.ylim(y_min, y_max)
+    plt.show()
+
+
 def create_time_series_plots(
-    time_series_data: Dict[str, Dict[str, List]], analyses: List[Dict[str, Any]]
+    time_series_data: Dict[str, Dict[str, np.ndarray]],
+    analyses: List[Dict[str, Any]],
 ):
     """Create time series plots for each metric using plotext."""
     if not PLOTEXT_AVAILABLE:
@@ -58,104 +113,46 @@ def create_time_series_plots(
     if not time_series_data:
         return
 
-    colors = ["red", "green", "blue", "yellow", "magenta", "cyan", "white"]
     console.print("\n")
     console.print("[bold]📈 Time Series Analysis[/bold]")
     console.print("Showing performance trends over time for each dataset\n")
 
     has_real_timestamps = any(
-        isinstance(data["timestamps"][0], float)
+        data["timestamps"].dtype.kind == "f"
         for data in time_series_data.values()
-        if data["timestamps"]
+        if data["timestamps"].size
     )
     x_label = "Time (minutes)" if has_real_timestamps else "Test Sequence"
 
-    all_download_speeds = []
-    all_upload_speeds = []
-    all_latencies = []
-    for data in time_series_data.values():
-        all_download_speeds.extend(data["download_speeds"])
-        all_upload_speeds.extend(data["upload_speeds"])
-        all_latencies.extend(data["latencies"])
-
-    download_padding = (max(all_download_speeds) - min(all_download_speeds)) * 0.1
-    upload_padding = (max(all_upload_speeds) - min(all_upload_speeds)) * 0.1
-    latency_padding = (max(all_latencies) - min(all_latencies)) * 0.1
-    download_min = max(0, min(all_download_speeds) - download_padding)
-    download_max = max(all_download_speeds) + download_padding
-    upload_min = max(0, min(all_upload_speeds) - upload_padding)
-    upload_max = max(all_upload_speeds) + upload_padding
-    latency_min = max(0, min(all_latencies) - latency_padding)
-    latency_max = max(all_latencies) + latency_padding
-
-    plot_width = 80
-    plot_height = 20
-
-    plt.clf()
-    plt.plotsize(plot_width, plot_height)
-    plt.title("📊 Download Speeds Over Time")
-    plt.xlabel(x_label)
-    plt.ylabel("Download Speed (Mbps)")
-    for idx, (filename, data) in enumerate(time_series_data.items()):
-        color = colors[idx % len(colors)]
-        analysis = next((a for a in analyses if a["filename"] == filename), None)
-        label = (
-            format_dataset_name(analysis)
-            if analysis
-            else filename.replace(".json", "").replace("_", " ").title()
-        )
-        plt.plot(
-            data["timestamps"],
-            data["download_speeds"],
-            label=label,
-            color=color,
-            marker="braille",
-        )
-    plt.ylim(download_min, download_max)
-    plt.show()
-
-    plt.clf()
-    plt.plotsize(plot_width, plot_height)
-    plt.title("📈 Upload Speeds Over Time")
-    plt.xlabel(x_label)
-    plt.ylabel("Upload Speed (Mbps)")
-    for idx, (filename, data) in enumerate(time_series_data.items()):
-        color = colors[idx % len(colors)]
-        analysis = next((a for a in analyses if a["filename"] == filename), None)
-        label = (
-            format_dataset_name(analysis)
-            if analysis
-            else filename.replace(".json", "").replace("_", " ").title()
-        )
-        plt.plot(
-            data["timestamps"],
-            data["upload_speeds"],
-            label=label,
-            color=color,
-            marker="braille",
-        )
-    plt.ylim(upload_min, upload_max)
-    plt.show()
-
-    plt.clf()
-    plt.plotsize(plot_width, plot_height)
-    plt.title("⚡ Latency Over Time")
-    plt.xlabel(x_label)
-    plt.ylabel("Latency (ms)")
-    for idx, (filename, data) in enumerate(time_series_data.items()):
-        color = colors[idx % len(colors)]
-        analysis = next((a for a in analyses if a["filename"] == filename), None)
-        label = (
-            format_dataset_name(analysis)
-            if analysis
-            else filename.replace(".json", "").replace("_", " ").title()
-        )
-        plt.plot(
-            data["timestamps"],
-            data["latencies"],
-            label=label,
-            color=color,
-            marker="braille",
-        )
-    plt.ylim(latency_min, latency_max)
-    plt.show()
+    download_min, download_max = _axis_limits(time_series_data, "download_speeds")
+    upload_min, upload_max = _axis_limits(time_series_data, "upload_speeds")
+    latency_min, latency_max = _axis_limits(time_series_data, "latencies")
+    series = _plot_series(time_series_data, analyses)
+
+    _render_series(
+        series,
+        "download_speeds",
+        "📊 Download Speeds Over Time",
+        x_label,
+        "Download Speed (Mbps)",
+        download_min,
+        download_max,
+    )
+    _render_series(
+        series,
+        "upload_speeds",
+        "📈 Upload Speeds Over Time",
+        x_label,
+        "Upload Speed (Mbps)",
+        upload_min,
+        upload_max,
+    )
+    _render_series(
+        series,
+        "latencies",
+        "⚡ Latency Over Time",
+        x_label,
+        "Latency (ms)",
+        latency_min,
+        latency_max,
+    )